@@ -1,7 +1,7 @@
 from click import Context, group, make_pass_decorator, option
 from pathlib import Path
 
-from backend.configuration import Configuration
+from backend.configuration import Configuration, get_configuration
 
 
 pass_configuration = make_pass_decorator(Configuration)
@@ -15,7 +15,7 @@ def entry_point():
 @pass_context
 @option("ini-file", type=Path)
 def grp_main(ctx: Context, ini_file: Path | None = None):
-    configuration = Configuration.parse_obj(dict(_ini_file=ini_file))
+    configuration = get_configuration(ini_file)
     ctx.obj = configuration
 
 
@@ -1,4 +1,5 @@
 import configparser
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 from urllib.parse import urlparse
@@ -55,17 +56,46 @@ def ini_settings(settings: PydanticBaseSettings) -> dict:
     if not ini_file.exists():
         return {}
 
-    parser = configparser.SafeConfigParser()
-    parser.read_string(ini_file.read_text())
+    try:
+        parser = _load_ini(ini_file, ini_file.stat().st_mtime)
+    except OSError:
+        # NOTE: the file can disappear between the `exists` check and being read
+        return {}
 
-    ini_section_str = settings.__config__.ini_section or parser.default_section
+    ini_section_str = settings.__config__.ini_section or configparser.DEFAULTSECT
+    # NOTE: only the requested section is interpolated - other sections may hold values that fail to interpolate
     return dict(parser[ini_section_str])
 
 
+@lru_cache(maxsize=8)
+def _load_ini(ini_file: Path, mtime: float) -> configparser.ConfigParser:
+    """
+    Parses an ini file - the returned parser is shared between callers and must be treated as read-only.
+
+    `mtime` is only used as part of the cache key - a modified file is re-parsed rather than served from the cache.
+    """
+    # NOTE: `ConfigParser` (what `SafeConfigParser` aliased) keeps `%` interpolation - e.g., `%%` is read as `%`
+    parser = configparser.ConfigParser()
+    with ini_file.open(encoding="utf-8") as f:
+        parser.read_file(f)
+    return parser
+
+
 class Configuration(BaseSettings):
     """
     Configuration for the backend.
     """
 
     class Config(BaseSettings.Config):
+        allow_mutation = False
         ini_section = "bot"
+
+
+@lru_cache(maxsize=8)
+def get_configuration(ini_file: Path | None = None) -> Configuration:
+    """
+    Gets the configuration for the provided `ini_file`.
+
+    Configuration is cached - repeated calls with the same `ini_file` return the same (immutable) instance.
+    """
+    return Configuration.parse_obj(dict(_ini_file=ini_file))
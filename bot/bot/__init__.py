@@ -1,8 +1,30 @@
-import bot.commands
-import bot.tasks
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .bot import bot
-from .configuration import Configuration
-from .logs import configure_loggers
+if TYPE_CHECKING:
+    from .bot import get_bot
+    from .configuration import Configuration
+    from .logs import configure_loggers
 
-__all__ = ["bot", "Configuration", "configure_loggers"]
+__all__ = ["get_bot", "Configuration", "configure_loggers"]
+
+# NOTE: maps public attributes to the submodules defining them - these are imported on first access (see `__getattr__`)
+_lazy_attributes = {
+    "get_bot": ".bot",
+    "Configuration": ".configuration",
+    "configure_loggers": ".logs",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily imports public attributes of the package on first access.
+
+    Avoids pulling in heavy dependencies (e.g., discord, wavelink) when they aren't needed.
+    """
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_lazy_attributes[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -1,46 +1,60 @@
+import hashlib
+import json
 import logging
-from typing import Type
+import os
+from functools import lru_cache
+from pathlib import Path
 
-from discord import Intents
-from discord.ext.commands import Cog, Context
+from discord import Intents, Member, VoiceState
+from discord.ext.commands import Context
 from discord.ext.commands.bot import Bot as BaseBot
-from wavelink import Node, NodePool
+from wavelink import Node, NodePool, TrackEventPayload
 
 from bot.configuration import Configuration
+from bot.player import Player
 
 logger = logging.getLogger(__name__)
 
+# NOTE: modules defining a `setup(bot)` function - loaded as extensions during startup (see `Bot.setup_hook`)
+extensions = [
+    "bot.commands.join",
+    "bot.commands.leave",
+    "bot.commands.queue",
+    "bot.commands.url",
+    "bot.commands.youtube",
+    "bot.tasks.wordle",
+]
+
 
 class Bot(BaseBot):
+    _allowed_guild_id: int | None
     _configuration: Configuration | None
-    _cog_classes: list[Type[Cog]]
+    command_tree_hash_file: Path
+    force_command_tree_sync: bool
 
     def __init__(self):
         intents = Intents.default()
         intents.message_content = True
         super().__init__(command_prefix=";;", intents=intents)
+        self._allowed_guild_id = None
         self._configuration = None
-        self._cog_classes = []
-
-    def cog(self, cog_class: Type[Cog]):
-        """
-        Registers a cog with the bot using the provided `name`
-        """
-        self._cog_classes.append(cog_class)
+        cache_path = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        self.command_tree_hash_file = cache_path.joinpath("bot", "tree.hash")
+        self.force_command_tree_sync = False
 
     async def guild_check(self, ctx: Context):
         """
         Ensures the bot only listens to events originating from the configured guild
         """
-        if not ctx.guild:
-            return False
-        return ctx.guild.id == self.get_configuration().discord_server_id
+        return bool(ctx.guild and ctx.guild.id == self._allowed_guild_id)
 
     def configure(self, configuration: Configuration):
         """
         Attaches the provided configuration to the bot.
         """
         self._configuration = configuration
+        # NOTE: cached to avoid configuration lookups on every command invocation (see `guild_check`)
+        self._allowed_guild_id = configuration.discord_server_id
 
     def get_configuration(self) -> Configuration:
         """
@@ -58,22 +72,85 @@ class Bot(BaseBot):
 
         Synchronizes registered application commands with the discord servers
         """
-        # initialize cogs
-        configuration = self.get_configuration()
-        guild = self.get_guild(configuration.discord_server_id)
-        if not guild:
-            raise RuntimeError(f"guild not found: {configuration.discord_server_id}")
-        for cog_class in self._cog_classes:
-            cog = cog_class()
-            await self.add_cog(cog, guild=guild)
-
         # sync commands with server
+        await self.sync_command_tree()
+
+    async def sync_command_tree(self):
+        """
+        Synchronizes the application command tree with the discord servers.
+
+        Syncing uploads every command - and is skipped when the command tree is unchanged since the last sync.
+        (Determined by comparing a hash of the command tree to the one persisted at `command_tree_hash_file`)
+
+        NOTE: the hash only reflects syncs performed from this host - set `force_command_tree_sync` to sync regardless
+        (e.g., if commands were changed elsewhere under the same application).
+        """
+        commands = [command.to_dict() for command in self.tree.get_commands()]
+        commands.sort(key=lambda command: command["name"])
+        data = json.dumps(
+            {"application_id": self.application_id, "commands": commands},
+            sort_keys=True,
+        )
+        digest = hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+        hash_file = self.command_tree_hash_file
+        try:
+            if not self.force_command_tree_sync and hash_file.read_text() == digest:
+                logger.debug("command tree unchanged - skipping sync")
+                return
+        except OSError:
+            pass
+
         await self.tree.sync()
 
+        # NOTE: write to a temporary file and then replace the hash file - ensuring the hash file is never partially written
+        try:
+            hash_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = hash_file.with_name(f"{hash_file.name}.tmp")
+            temp_file.write_text(digest)
+            os.replace(temp_file, hash_file)
+        except OSError as e:
+            # NOTE: the sync succeeded - an unwritable cache only means the next start will sync again
+            logger.warning(f"unable to write command tree hash: {hash_file} ({e})")
+
+    async def on_voice_state_update(
+        self, member: Member, before: VoiceState, after: VoiceState
+    ):
+        """
+        Called when a member's voice state changes (e.g., joining or leaving a voice channel).
+
+        Notifies the guild's player of potential activity.
+        """
+        player = member.guild.voice_client
+        if isinstance(player, Player):
+            player.notify_activity()
+
+    async def on_wavelink_track_start(self, payload: TrackEventPayload):
+        """
+        Called when a player starts playing a track.
+
+        Notifies the player of activity.
+        """
+        if isinstance(payload.player, Player):
+            payload.player.notify_activity()
+
+    async def on_wavelink_track_end(self, payload: TrackEventPayload):
+        """
+        Called when a player finishes playing a track.
+
+        Notifies the player of potential inactivity (e.g., the queue has run out of tracks).
+        """
+        if isinstance(payload.player, Player):
+            payload.player.notify_activity()
+
     async def setup_hook(self):
         """
         Called after launch but before being ready.  Allows initialization + configuration of other dependencies
         """
+        # load extensions (commands, cogs)
+        for extension in extensions:
+            await self.load_extension(extension)
+
         # initialize wavelink
         configuration = self.get_configuration()
         kwargs: dict = {"password": configuration.get_lavalink_password()}
@@ -92,7 +169,14 @@ class Bot(BaseBot):
         Wrapper around the superclasses' `run` method - but utilizes the attached configuration to start the bot.
         """
         configuration = self.get_configuration()
+        # NOTE: discord loggers are configured by `configure_loggers` - don't let discord.py attach a duplicate handler
+        kwargs.setdefault("log_handler", None)
         return super().run(configuration.discord_api_token, **kwargs)
 
 
-bot = Bot()
+@lru_cache(maxsize=1)
+def get_bot() -> Bot:
+    """
+    Gets the bot - creating it on first call.
+    """
+    return Bot()
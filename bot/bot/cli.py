@@ -2,8 +2,7 @@ from pathlib import Path
 
 import click
 
-from bot.bot import bot
-from bot.configuration import Configuration
+from bot.configuration import Configuration, get_configuration
 from bot.logs import configure_loggers
 
 
@@ -18,15 +17,36 @@ pass_configuration = click.make_pass_decorator(Configuration)
 @click.option("--ini-file", type=Path)
 @click.pass_context
 def grp_main(context: click.Context, ini_file: Path | None = None):
-    configuration = Configuration.parse_obj(dict(_ini_file=ini_file))
+    configuration = get_configuration(ini_file)
     context.obj = configuration
     configure_loggers()
 
 
 @grp_main.command("run")
+@click.option(
+    "--force-sync",
+    is_flag=True,
+    help="Sync the command tree with discord even if it appears unchanged.",
+)
 @pass_configuration
-def cmd_run(configuration: Configuration):
+def cmd_run(configuration: Configuration, force_sync: bool = False):
+    # NOTE: imported here to avoid loading the bot for other commands (e.g., --help)
+    import asyncio
+
+    from bot.bot import get_bot
+
+    # use uvloop's (faster) event loop if installed (see the 'uvloop' optional dependency)
+    # NOTE: `uvloop.install` is deprecated - set the event loop policy directly
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    bot = get_bot()
     bot.configure(configuration)
+    bot.force_command_tree_sync = force_sync
     bot.run()
 
 
@@ -1,12 +1,12 @@
-from discord import Interaction
+from discord import Interaction, app_commands
 
-from bot.bot import bot
+from bot.bot import Bot
 from bot.error import BotCommandError
 from bot.player import Player
 from bot.utils import get_bot_voice_data, get_user_voice_channel
 
 
-@bot.tree.command(description="asks the bot to join your voice channel")
+@app_commands.command(description="asks the bot to join your voice channel")
 async def join(interaction: Interaction):
     user_voice_channel = get_user_voice_channel(interaction)
     if not user_voice_channel:
@@ -28,3 +28,10 @@ async def join(interaction: Interaction):
         await interaction.response.send_message(
             f"The bot has joined your voice channel"
         )
+
+
+async def setup(bot: Bot):
+    """
+    Adds the `join` command to the bot (called when the bot loads this module as an extension).
+    """
+    bot.tree.add_command(join)
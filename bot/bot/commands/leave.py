@@ -1,11 +1,11 @@
-from discord import Interaction
+from discord import Interaction, app_commands
 
-from bot.bot import bot
+from bot.bot import Bot
 from bot.error import BotCommandError
 from bot.utils import get_bot_voice_data, get_user_voice_channel
 
 
-@bot.tree.command(description="asks the bot to leave its voice channel")
+@app_commands.command(description="asks the bot to leave its voice channel")
 async def leave(interaction: Interaction):
     bot_voice_data = get_bot_voice_data(interaction)
     if not bot_voice_data:
@@ -21,3 +21,10 @@ async def leave(interaction: Interaction):
 
     await bot_voice_client.leave()
     await interaction.response.send_message(f"The bot has left its voice channel")
+
+
+async def setup(bot: Bot):
+    """
+    Adds the `leave` command to the bot (called when the bot loads this module as an extension).
+    """
+    bot.tree.add_command(leave)
@@ -1,10 +1,11 @@
+import asyncio
 from typing import Literal
 
-from discord import ButtonStyle, Interaction, SelectOption
+from discord import ButtonStyle, Interaction, SelectOption, app_commands
 from discord.ui import button, select
 from wavelink import Playable
 
-from bot.bot import bot
+from bot.bot import Bot
 from bot.utils import (
     ensure_bot_voice_data,
     get_bot_voice_data,
@@ -27,13 +28,21 @@ class View(BaseView):
     page_number: int
     page_size: int
     skip_selected_track: Playable | None
+    # identifies the page (page number + tracks) that the skip select list was last built for
+    skip_select_page: tuple[int, tuple[Playable, ...]] | None
+    # counts requested updates - used to coalesce updates requested in quick succession (see `View.update`)
+    update_count: int
+    update_delay: float
 
     def __init__(self, interaction: Interaction):
         super().__init__(interaction=interaction)
         self.page_number = 0
         self.page_size = 25
         self.skip_selected_track = None
+        self.skip_select_page = None
         self.state = "open"
+        self.update_count = 0
+        self.update_delay = 0.05
 
     def get_queue(self) -> list[Playable]:
         """
@@ -48,19 +57,19 @@ class View(BaseView):
             queue.extend(bot_voice_client.queue)
         return queue
 
-    def get_max_page_number(self) -> int:
+    def get_max_page_number(self, queue: list[Playable]) -> int:
         """
         Helper method that determines the last page of queue data.
         """
-        return int(len(self.get_queue()) / self.page_size)
+        return max(0, (len(queue) - 1) // self.page_size)
 
-    def get_current_page(self) -> list[Playable]:
+    def get_current_page(self, queue: list[Playable]) -> list[Playable]:
         """
-        Derives the current page from 'page_number' and 'page_size'
+        Derives the current page of queue data from 'page_number' and 'page_size'
         """
         start_index = self.page_number * self.page_size
         end_index = start_index + self.page_size
-        return self.get_queue()[start_index:end_index]
+        return queue[start_index:end_index]
 
     def get_icon(self) -> str:
         """
@@ -76,62 +85,65 @@ class View(BaseView):
     async def update(self, interaction: Interaction | None = None):
         """
         Prepares and dispatches a view update to the discord servers
+
+        Updates requested in quick succession (e.g., rapid button clicks) are coalesced - only the latest update is
+        dispatched, while the interactions of superseded updates are acknowledged without editing the message.
         """
+        self.update_count += 1
+        update_count = self.update_count
+        await asyncio.sleep(self.update_delay)
+        if update_count != self.update_count:
+            if interaction:
+                await interaction.response.defer()
+            return
+
         complete = False
         show_actions = False
 
         if self.state == "open":
-            # ensure that the page number is within bounds
-            self.page_number = min(self.page_number, self.get_max_page_number())
+            # NOTE: fetch the queue once - it's used throughout the update
+            queue = self.get_queue()
 
-            # clear the existing select list
-            self.skip_select._underlying.options.clear()
+            # ensure that the page number is within bounds
+            self.page_number = min(self.page_number, self.get_max_page_number(queue))
+            page = self.get_current_page(queue)
 
             # build the queue text and select list
+            # NOTE: select lists cannot be empty - use an empty option if there are no items in the page
             offset = self.page_number * self.page_size
-            lines = []
-            for index, item in enumerate(self.get_current_page()):
-                queue_position = offset + index
-                icon = ""
-                if queue_position == 0:
-                    icon = self.get_icon()
-
-                lines.append(f"{queue_position + 1}. {icon} {item.title}")
-                select_option = SelectOption(
-                    label=f"{queue_position + 1}. {item.title}",
-                    value=str(queue_position),
-                    default=self.skip_selected_track == item,
-                )
-                self.skip_select.append_option(select_option)
-            content = "\n".join(lines)
+            items = list(enumerate(page, start=offset))
+            icon = self.get_icon() if offset == 0 and page else ""
+            content = "\n".join(
+                f"{position + 1}. {icon if position == 0 else ''} {item.title}"
+                for position, item in items
+            )
+            # NOTE: if the page is unchanged (e.g., a different track was selected) only update the selected option
+            skip_select_page = (self.page_number, tuple(page))
+            if skip_select_page == self.skip_select_page:
+                for option, item in zip(self.skip_select.options, page):
+                    option.default = self.skip_selected_track == item
+            else:
+                self.skip_select.options = [
+                    SelectOption(
+                        label=f"{position + 1}. {item.title}",
+                        value=str(position),
+                        default=self.skip_selected_track == item,
+                    )
+                    for position, item in items
+                ] or [empty_select_option]
+                self.skip_select_page = skip_select_page
 
             # configure UI component enablement
-            self.play_pause_button.disabled = any(
-                [
-                    len(self.get_queue()) == 0,
-                    not is_user_in_bot_voice_channel(self.interaction),
-                ]
-            )
+            in_channel = is_user_in_bot_voice_channel(self.interaction)
+            self.play_pause_button.disabled = not queue or not in_channel
             self.next_page_button.disabled = (
-                self.page_number >= self.get_max_page_number()
+                self.page_number >= self.get_max_page_number(queue)
             )
             self.prev_page_button.disabled = self.page_number <= 0
-            self.skip_select.disabled = any(
-                [
-                    len(self.get_current_page()) == 0,
-                    not is_user_in_bot_voice_channel(self.interaction),
-                ]
-            )
-            self.skip_button.disabled = any(
-                [
-                    len(self.get_current_page()) == 0,
-                    self.skip_selected_track is None,
-                    not is_user_in_bot_voice_channel(self.interaction),
-                ]
+            self.skip_select.disabled = not page or not in_channel
+            self.skip_button.disabled = (
+                not page or self.skip_selected_track is None or not in_channel
             )
-            # NOTE: select lists cannot be empty - use an empty option if there are no items in the page
-            if not self.get_current_page():
-                self.skip_select.append_option(empty_select_option)
 
             show_actions = True
         elif self.state == "closed":
@@ -198,7 +210,7 @@ class View(BaseView):
 
     @button(label="Next", row=2, style=ButtonStyle.secondary)
     async def next_page_button(self, interaction: Interaction, button):
-        max_page_number = int(len(self.get_queue()) / self.page_size)
+        max_page_number = self.get_max_page_number(self.get_queue())
         self.page_number = min(self.page_number + 1, max_page_number)
         self.skip_selected_track = None
         await self.update(interaction=interaction)
@@ -209,6 +221,13 @@ class View(BaseView):
         await self.update(interaction=interaction)
 
 
-@bot.tree.command(description="interact with the bot's current audio queue")
+@app_commands.command(description="interact with the bot's current audio queue")
 async def queue(interaction: Interaction):
     await View.create(interaction=interaction)
+
+
+async def setup(bot: Bot):
+    """
+    Adds the `queue` command to the bot (called when the bot loads this module as an extension).
+    """
+    bot.tree.add_command(queue)
@@ -1,12 +1,12 @@
 import wavelink
-from discord import Interaction
+from discord import Interaction, app_commands
 
-from bot.bot import bot
+from bot.bot import Bot
 from bot.error import BotCommandError
 from bot.utils import call_command, ensure_bot_voice_data
 
 
-@bot.tree.command(description="add an audio url to the bot's current audio queue")
+@app_commands.command(description="add an audio url to the bot's current audio queue")
 async def url(interaction: Interaction, url: str):
     from bot.commands.join import join
 
@@ -24,3 +24,10 @@ async def url(interaction: Interaction, url: str):
     await interaction.response.send_message(
         f"Added '{url}' to the bot's current audio queue"
     )
+
+
+async def setup(bot: Bot):
+    """
+    Adds the `url` command to the bot (called when the bot loads this module as an extension).
+    """
+    bot.tree.add_command(url)
@@ -1,15 +1,31 @@
 from typing import Coroutine, Literal
 
-from discord import ButtonStyle, Interaction
+from discord import ButtonStyle, Interaction, app_commands
 from discord.ui import View as BaseView
 from discord.ui import button
 from wavelink import YouTubeTrack
 
-from bot.bot import bot
+from bot.bot import Bot
 from bot.utils import call_command, ensure_bot_voice_data, ensure_instance
 from bot.view import View as BaseView
 
 
+def select_track_button(index: int):
+    """
+    Helper function that defines a button that selects the track at `index` within the current page of results.
+
+    (Must be assigned within the `View` class body so that discord.py registers the button with the view)
+    """
+
+    @button(label=f"{index + 1}", row=0, style=ButtonStyle.primary)
+    async def select_track_button(self: "View", interaction: Interaction, button):
+        await self.select_track(interaction, index)
+
+    # NOTE: discord.py exposes buttons on view instances by callback name - match the attribute name in `View`
+    select_track_button.__name__ = f"select_track_{index + 1}_button"
+    return select_track_button
+
+
 class View(BaseView):
     """
     Provides a view that allows users to query youtube and select a video to add to the bot's audio queue
@@ -21,9 +37,9 @@ class View(BaseView):
     page_size: int
     query: str
     selected_track: YouTubeTrack | None
-    state: Literal["fetch"] | Literal["results"] | Literal["selection"] | Literal[
-        "closed"
-    ]
+    state: (
+        Literal["fetch"] | Literal["results"] | Literal["selection"] | Literal["closed"]
+    )
     tracks: list[YouTubeTrack]
 
     def __init__(self, interaction: Interaction, query: str):
@@ -43,7 +59,7 @@ class View(BaseView):
         """
         Returns the last page of the search results
         """
-        return int(len(self.tracks) / self.page_size)
+        return max(0, (len(self.tracks) - 1) // self.page_size)
 
     def get_current_page(self) -> list[YouTubeTrack]:
         """
@@ -66,26 +82,30 @@ class View(BaseView):
             tasks.append(self.fetch_tracks())
 
         elif self.state == "results":
+            page = self.get_current_page()
+            total_pages = self.get_total_pages()
+
             # prepare the text content
-            lines = []
-            lines.append(f"Showing results for '{self.query}'.")
-            lines.append(f"[ {self.page_number + 1} / {self.get_total_pages() + 1} ]")
-            for index, item in enumerate(self.get_current_page()):
-                lines.append(f"{index + 1}. {item.title}")
-            content = "\n".join(lines)
+            content = "\n".join(
+                [
+                    f"Showing results for '{self.query}'.",
+                    f"[ {self.page_number + 1} / {total_pages + 1} ]",
+                    *(f"{index + 1}. {item.title}" for index, item in enumerate(page)),
+                ]
+            )
 
             # handle UI component enablement
             buttons = [
-                self.one_button,
-                self.two_button,
-                self.three_button,
-                self.four_button,
-                self.five_button,
+                self.select_track_1_button,
+                self.select_track_2_button,
+                self.select_track_3_button,
+                self.select_track_4_button,
+                self.select_track_5_button,
             ]
-            self.next_button.disabled = self.page_number >= self.get_total_pages()
+            self.next_button.disabled = self.page_number >= total_pages
             self.prev_button.disabled = self.page_number <= 0
             for index, button in enumerate(buttons):
-                button.disabled = index >= len(self.get_current_page())
+                button.disabled = index >= len(page)
 
             show_actions = True
         elif self.state == "selection":
@@ -133,25 +153,11 @@ class View(BaseView):
 
         await self.update(interaction=interaction)
 
-    @button(label="1", row=0, style=ButtonStyle.primary)
-    async def one_button(self, interaction: Interaction, button):
-        await self.select_track(interaction, 0)
-
-    @button(label="2", row=0, style=ButtonStyle.primary)
-    async def two_button(self, interaction: Interaction, button):
-        await self.select_track(interaction, 1)
-
-    @button(label="3", row=0, style=ButtonStyle.primary)
-    async def three_button(self, interaction: Interaction, button):
-        await self.select_track(interaction, 2)
-
-    @button(label="4", row=0, style=ButtonStyle.primary)
-    async def four_button(self, interaction: Interaction, button):
-        await self.select_track(interaction, 3)
-
-    @button(label="5", row=0, style=ButtonStyle.primary)
-    async def five_button(self, interaction: Interaction, button):
-        await self.select_track(interaction, 4)
+    select_track_1_button = select_track_button(0)
+    select_track_2_button = select_track_button(1)
+    select_track_3_button = select_track_button(2)
+    select_track_4_button = select_track_button(3)
+    select_track_5_button = select_track_button(4)
 
     @button(label="Previous", row=1, style=ButtonStyle.secondary)
     async def prev_button(self, interaction: Interaction, button):
@@ -160,8 +166,7 @@ class View(BaseView):
 
     @button(label="Next", row=1, style=ButtonStyle.secondary)
     async def next_button(self, interaction: Interaction, button):
-        max_page = int(len(self.tracks) / self.page_size)
-        self.page_number = min(self.page_number + 1, max_page)
+        self.page_number = min(self.page_number + 1, self.get_total_pages())
         await self.update(interaction=interaction)
 
     @button(label="Cancel", row=1, style=ButtonStyle.danger)
@@ -170,6 +175,15 @@ class View(BaseView):
         await self.update(interaction=interaction)
 
 
-@bot.tree.command(description="adds a youtube video to the bot's current audio queue")
+@app_commands.command(
+    description="adds a youtube video to the bot's current audio queue"
+)
 async def youtube(interaction: Interaction, *, query: str):
     await View.create(interaction=interaction, query=query)
+
+
+async def setup(bot: Bot):
+    """
+    Adds the `youtube` command to the bot (called when the bot loads this module as an extension).
+    """
+    bot.tree.add_command(youtube)
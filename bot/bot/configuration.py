@@ -1,12 +1,13 @@
 import configparser
+from functools import lru_cache
 from pathlib import Path
-from typing import ClassVar
-from urllib.parse import urlparse
+from typing import ClassVar, Type
+from urllib.parse import ParseResult, urlparse
 
 from pydantic import BaseSettings as PydanticBaseSettings
 from pydantic.env_settings import SettingsSourceCallable
 
-from bot.utils import ensure_subclass
+from bot.ensure import ensure_subclass
 
 
 class BaseSettings(PydanticBaseSettings):
@@ -27,13 +28,23 @@ class BaseSettings(PydanticBaseSettings):
         ) -> tuple[SettingsSourceCallable, ...]:
             return init_settings, env_settings, ini_settings
 
+    # NOTE: the model's config (`__config__`) - verified once per class (see `__init_subclass__`)
+    _resolved_config: ClassVar[Type["BaseSettings.Config"]]
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Verifies the model's config is compatible with `BaseSettings.Config` and stores it on the class.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._resolved_config = ensure_subclass(cls.__config__, BaseSettings.Config)
+
     def __init__(
         self,
         _ini_file: Path | str | None = None,
         _ini_section: None | str = None,
         **kwargs,
     ):
-        config = ensure_subclass(self.__config__, self.Config)
+        config = type(self)._resolved_config
 
         if _ini_file:
             config.ini_file = _ini_file
@@ -48,7 +59,7 @@ def ini_settings(settings: PydanticBaseSettings) -> dict:
     """
     if not isinstance(settings, BaseSettings):
         return {}
-    config = ensure_subclass(settings.__config__, BaseSettings.Config)
+    config = type(settings)._resolved_config
 
     ini_file = config.ini_file
     if not ini_file:
@@ -58,19 +69,38 @@ def ini_settings(settings: PydanticBaseSettings) -> dict:
     if not ini_file.exists():
         return {}
 
-    parser = configparser.SafeConfigParser()
-    parser.read_string(ini_file.read_text())
+    try:
+        parser = _load_ini(ini_file, ini_file.stat().st_mtime)
+    except OSError:
+        # NOTE: the file can disappear between the `exists` check and being read
+        return {}
 
-    ini_section_str = config.ini_section or parser.default_section
+    ini_section_str = config.ini_section or configparser.DEFAULTSECT
+    # NOTE: only the requested section is interpolated - other sections may hold values that fail to interpolate
     return dict(parser[ini_section_str])
 
 
+@lru_cache(maxsize=8)
+def _load_ini(ini_file: Path, mtime: float) -> configparser.ConfigParser:
+    """
+    Parses an ini file - the returned parser is shared between callers and must be treated as read-only.
+
+    `mtime` is only used as part of the cache key - a modified file is re-parsed rather than served from the cache.
+    """
+    # NOTE: `ConfigParser` (what `SafeConfigParser` aliased) keeps `%` interpolation - e.g., `%%` is read as `%`
+    parser = configparser.ConfigParser()
+    with ini_file.open(encoding="utf-8") as f:
+        parser.read_file(f)
+    return parser
+
+
 class Configuration(BaseSettings):
     """
     Configuration for the bot.
     """
 
     class Config(BaseSettings.Config):
+        allow_mutation = False
         ini_section = "bot"
         env_prefix = "BOT_"
 
@@ -80,8 +110,34 @@ class Configuration(BaseSettings):
     lavalink_url: str
 
     def get_lavalink_password(self) -> str | None:
-        return urlparse(self.lavalink_url).password
+        return parse_url(self.lavalink_url).password
 
     def get_lavalink_uri(self) -> str:
-        parts = urlparse(self.lavalink_url)
-        return f"{parts.scheme}://{parts.hostname}:{parts.port}"
+        return get_uri(self.lavalink_url)
+
+
+@lru_cache(maxsize=8)
+def parse_url(url: str) -> ParseResult:
+    """
+    Parses the provided `url` - caching the result, as configured urls are parsed repeatedly.
+    """
+    return urlparse(url)
+
+
+@lru_cache(maxsize=8)
+def get_uri(url: str) -> str:
+    """
+    Derives a uri (scheme, hostname and port) from the provided `url` - caching the result, like `parse_url`.
+    """
+    parts = parse_url(url)
+    return f"{parts.scheme}://{parts.hostname}:{parts.port}"
+
+
+@lru_cache(maxsize=8)
+def get_configuration(ini_file: Path | None = None) -> Configuration:
+    """
+    Gets the configuration for the provided `ini_file`.
+
+    Configuration is cached - repeated calls with the same `ini_file` return the same (immutable) instance.
+    """
+    return Configuration.parse_obj(dict(_ini_file=ini_file))
@@ -0,0 +1,33 @@
+from typing import Any, Type, TypeVar
+
+Instance = TypeVar("Instance")
+
+
+def ensure_subclass(obj: Any, v: Type[Instance]) -> Type[Instance]:
+    """
+    Convenience method that asserts a provided object is an subclass of the provided type.
+
+    This is because:
+    * `assert` statements can be removed from optimized python code
+    * typing.TypeGuard requires a `bool` function, and thus, an if statement - negating any benefit of a helper method
+    """
+    if not issubclass(obj, v):
+        raise RuntimeError(
+            f"not a {v.__qualname__} subclass ({type(obj).__qualname__})"
+        )
+    return obj
+
+
+def ensure_instance(obj: Any, v: Type[Instance]) -> Instance:
+    """
+    Convenience method that asserts a provided object is an instance of the provided type.
+
+    This is because:
+    * `assert` statements can be removed from optimized python code
+    * typing.TypeGuard requires a `bool` function, and thus, an if statement - negating any benefit of a helper method
+    """
+    if not isinstance(obj, v):
+        raise RuntimeError(
+            f"not an {v.__qualname__} instance ({type(obj).__qualname__})"
+        )
+    return obj
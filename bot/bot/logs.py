@@ -2,18 +2,28 @@ import logging
 
 import bot
 
+# NOTE: the handler attached by `configure_loggers` - used to ensure loggers are only configured once
+_handler: logging.Handler | None = None
+
 
 def configure_loggers():
     """
     Attaches a default configuration to the root logger for the package.
+
+    Subsequent calls are no-ops - preventing duplicate handlers (and thus, duplicate log lines).
     """
-    logger = logging.getLogger(bot.__name__)
+    global _handler
+    if _handler is not None:
+        return
+
     formatter = logging.Formatter("[%(asctime)s][%(name)s]: %(message)s")
-    handler = logging.StreamHandler()
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(formatter)
+
+    logger = logging.getLogger(bot.__name__)
+    logger.addHandler(_handler)
     logger.setLevel(logging.DEBUG)
 
     discord_logger = logging.getLogger("discord")
-    discord_logger.addHandler(handler)
+    discord_logger.addHandler(_handler)
     discord_logger.setLevel(logging.DEBUG)
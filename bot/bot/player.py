@@ -14,9 +14,10 @@ class Player(BasePlayer):
     Subclass of a `wavelink.Player` that provides some default configuration and helper methods
     utilized by bot commands.
     """
+    activity_event: asyncio.Event
     inactivity_interval: datetime.timedelta
     inactivity_timeout: datetime.timedelta
-    last_active: datetime.datetime
+    last_active: float
     monitor_inactivity_task: asyncio.Task | None
 
     def __init__(self, *args, **kwargs):
@@ -24,9 +25,10 @@ class Player(BasePlayer):
         # NOTE: if autoplay is not True, queue functionality is disabled
         self.autoplay = True
 
+        self.activity_event = asyncio.Event()
         self.inactivity_interval = datetime.timedelta(seconds=30)
         self.inactivity_timeout = datetime.timedelta(minutes=2)
-        self.last_active = datetime.datetime.now(tz=datetime.timezone.utc)
+        self.last_active = 0.0
         self.monitor_inactivity_task = None
 
     async def enqueue(self, track: Playable, position: int | None = None):
@@ -61,21 +63,33 @@ class Player(BasePlayer):
         If the player has been inactive for a fixed period of time (`inactivity_timeout`) - disconnect the player
          from the current voice channel
         """
-        self.last_active = datetime.datetime.now(tz=datetime.timezone.utc)
+        # NOTE: uses the event loop's monotonic clock (in seconds) for timing
+        loop = asyncio.get_running_loop()
+        interval_s = self.inactivity_interval.total_seconds()
+        timeout_s = self.inactivity_timeout.total_seconds()
+        self.last_active = loop.time()
+        fetched_channel = None
 
         while True:
-            now = datetime.datetime.now(tz=datetime.timezone.utc)
+            now = loop.time()
 
             # inactivity threshold has been reached - trigger a disconnection
-            if (now - self.last_active) >= self.inactivity_timeout:
+            if (now - self.last_active) >= timeout_s:
                 await self.disconnect()
                 break
                 
             # check voice channel is non-empty
+            # NOTE: prefer the client's channel cache - only fetch the channel (once) when it's missing from the cache
             is_channel_non_empty = False
             if self.channel:
                 try:
-                    channel = await self.client.fetch_channel(self.channel.id)
+                    channel = self.client.get_channel(self.channel.id)
+                    if channel is None:
+                        if not fetched_channel or fetched_channel.id != self.channel.id:
+                            fetched_channel = await self.client.fetch_channel(
+                                self.channel.id
+                            )
+                        channel = fetched_channel
                     channel = ensure_instance(channel, VoiceChannel)
                     if len(channel.members) > 1:
                         is_channel_non_empty = True
@@ -89,8 +103,34 @@ class Player(BasePlayer):
             if is_channel_non_empty and is_streaming_audio:
                 self.last_active = now
             
-            await asyncio.sleep(int(self.inactivity_interval.total_seconds()))
+            # wait until activity is signalled (see `notify_activity`) - or until the next interval
+            try:
+                await asyncio.wait_for(self.activity_event.wait(), timeout=interval_s)
+            except asyncio.TimeoutError:
+                pass
+            self.activity_event.clear()
+
+    def notify_activity(self):
+        """
+        Signals that the player's state may have changed (e.g., a track started, members joined/left the channel).
+
+        Wakes up `monitor_inactivity` so that it re-evaluates the player's activity.
+        """
+        self.activity_event.set()
 
+    async def pause(self, *args, **kwargs):
+        """
+        Wrapper around the superclasses' `pause` method - but notifies the player of activity.
+        """
+        await super().pause(*args, **kwargs)
+        self.notify_activity()
+
+    async def resume(self, *args, **kwargs):
+        """
+        Wrapper around the superclasses' `resume` method - but notifies the player of activity.
+        """
+        await super().resume(*args, **kwargs)
+        self.notify_activity()
 
     async def remove(self, track: Playable):
         """
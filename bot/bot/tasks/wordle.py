@@ -1,148 +1,436 @@
+import asyncio
 import datetime
 import logging
 import re
+from collections import defaultdict
+from typing import Coroutine
 
-from discord import ClientUser, Message, Reaction, TextChannel
+from discord import (
+    ClientUser,
+    Message,
+    Object,
+    PartialMessage,
+    RawBulkMessageDeleteEvent,
+    RawMessageDeleteEvent,
+    RawMessageUpdateEvent,
+    RawReactionActionEvent,
+    RawReactionClearEmojiEvent,
+    RawReactionClearEvent,
+    TextChannel,
+)
 from discord.ext import tasks
 from discord.ext.commands import Cog
+from discord.utils import time_snowflake
 
-from bot.bot import bot
+from bot.bot import Bot
 from bot.utils import ensure_instance
 
 logger = logging.getLogger(__name__)
 
+winner_emoji = "👑"
+brick_emoji = "🧱"
+green_emoji = "🟩"
+yellow_emoji = "🟨"
+brick_score = 1000
 
-def has_reaction(emoji: str, message: Message) -> bool:
+wordle_regex = re.compile(r"Wordle (\d+) (\d+|X)/\d+")
+
+# NOTE: the number of messages fetched per request when catching up on channel history
+history_limit = 200
+
+one_day = datetime.timedelta(days=1)
+two_days = datetime.timedelta(days=2)
+
+
+Results = defaultdict[int, defaultdict[int, dict[int, Message]]]
+
+
+def parse_result(content: str) -> tuple[int, int] | None:
+    """
+    Helper function that parses a wordle result (wordle number, score) from message content.
+
+    Returns None if the content doesn't contain a wordle result.
+    """
+    # NOTE: a substring check is far cheaper than a regex search - skip most non-wordle messages with it
+    if "Wordle " not in content:
+        return None
+    match = wordle_regex.search(content)
+    if not match:
+        return None
+    number, score = match.groups()
+
+    # transform brick score ('X') into a numeric value for consistent parsing
+    score = f"{brick_score}" if score == "X" else score
+
+    number, score = map(int, (number, score))
+    return number, score
+
+
+def get_bot_reactions(message: Message) -> set[str]:
     """
-    Helper function that returns True when the bot has reacted to a specific message.
+    Helper function that returns the emojis the bot has reacted to a specific message with.
     """
-    for reaction in message.reactions:
-        if reaction.emoji != emoji:
-            continue
-        if reaction.me:
-            return True
-    return False
+    return {reaction.emoji for reaction in message.reactions if reaction.me}
 
 
-async def add_reaction(emoji: str, message: Message):
+async def add_reaction(emoji: str, message: Message, bot_reactions: set[str]):
     """
     Helper function that reacts to a message using the bot user.
 
-    If the reaction already exists, is a no-op.
+    If the reaction already exists (per `bot_reactions`), is a no-op.  Otherwise, `bot_reactions` is updated.
     """
-    if not has_reaction(emoji, message):
+    if emoji not in bot_reactions:
         await message.add_reaction(emoji)
+        bot_reactions.add(emoji)
 
 
-async def remove_reaction(emoji: str, message: Message, user: ClientUser):
+async def remove_reaction(
+    emoji: str,
+    message: Message | PartialMessage,
+    user: ClientUser,
+    bot_reactions: set[str],
+):
     """
     Helper function that removes an existing bot reaction from a message
 
-    If no reaction exists, is a no-op.
+    If no reaction exists (per `bot_reactions`), is a no-op.  Otherwise, `bot_reactions` is updated.
     """
-    if has_reaction(emoji, message):
+    if emoji in bot_reactions:
         await message.remove_reaction(emoji, user)
+        bot_reactions.discard(emoji)
 
 
-@bot.cog
 class Wordle(Cog):
     """
-    Cog that polls a specific discord channel for wordle results.
+    Cog that watches a specific discord channel for wordle results.
 
     The current winners for the latest wordle puzzle receive a winner emoji reaction.
     Anyone who bricks the latest wordle puzzle (X/6) receives a brick emoji reaction.
     Any wordle boards with all green squares receives a green emoji reaction.
     Any wordle boards with all yellow squares receives a yellow emoji reaction.
+
+    Results are collected as messages are posted (see `Wordle.on_message`) and kept up-to-date as messages are
+    edited or deleted - as are the bot's reactions, if removed.  A periodic task catches up on any messages missed in
+    the meantime (e.g., while disconnected) and discards stale results (see `Wordle.loop`).
     """
 
-    def __init__(self):
+    bot: Bot
+    # wordle results collected so far (keyed by wordle number, then score, then message id)
+    results: Results
+    # emojis the bot has reacted to each collected message with (keyed by message id)
+    bot_reactions: dict[int, set[str]]
+    # the newest message collected by scanning channel history (see `Wordle.loop`)
+    # NOTE: only advanced by history scans - messages collected by `Wordle.on_message` can be newer than skipped ones
+    # NOTE: a message (rather than its creation time) pages exactly - creation times map to millisecond-wide id ranges
+    cursor: Object | None
+
+    def __init__(self, bot: Bot):
+        super().__init__()
+        self.bot = bot
+        self.results = defaultdict(lambda: defaultdict(dict))
+        self.bot_reactions = {}
+        self.cursor = None
+
+    async def cog_load(self):
+        """
+        Called when the cog is added to the bot - starts the periodic task.
+
+        (Deferred until here, rather than on construction, so the task only begins once the bot is configured)
+        """
         # treat all exceptions as retryable
         # TODO: determine more specific exception classes
         self.loop.add_exception_type(Exception)
         self.loop.start()
 
-    @tasks.loop(seconds=60.0)
-    async def loop(self):
+    async def cog_unload(self):
         """
-        Loop that performs wordle result polling.
+        Called when the cog is removed from the bot (e.g., the extension is reloaded) - stops the periodic task.
         """
-        try:
-            winner_emoji = "👑"
-            brick_emoji = "🧱"
-            green_emoji = "🟩"
-            yellow_emoji = "🟨"
-            brick_score = 1000
+        self.loop.cancel()
 
-            regex = re.compile(r"Wordle (\d+) ([\d]+|X)/\d+")
+    def add_result(self, message: Message) -> int | None:
+        """
+        Collects the wordle result (if any) contained within a message.
 
-            channel_id = bot.get_configuration().discord_wordle_channel_id
-            channel = ensure_instance(bot.get_channel(channel_id), TextChannel)
-            now = datetime.datetime.now(tz=datetime.timezone.utc)
-            one_day_ago = now - datetime.timedelta(days=1)
-            two_days_ago = now - datetime.timedelta(days=2)
-
-            # collect wordle results
-            results: dict[int, dict[int, list[Message]]] = {}
-            recent_results = False
-            async for message in channel.history(after=two_days_ago):
-                match = regex.search(message.content)
-                if not match:
+        Returns the wordle number of the collected result (or None if the message doesn't contain a wordle result).
+        """
+        result = parse_result(message.content)
+        if not result:
+            return None
+        number, score = result
+        self.results[number][score][message.id] = message
+        return number
+
+    def remove_result(self, message_id: int) -> int | None:
+        """
+        Discards the wordle result (if any) collected from a message - along with the bot's reactions to it.
+
+        Returns the wordle number of the discarded result (or None if no result was collected from the message).
+        """
+        self.bot_reactions.pop(message_id, None)
+        for number, scores in self.results.items():
+            for score, score_messages in scores.items():
+                if score_messages.pop(message_id, None) is None:
                     continue
-                if message.created_at >= one_day_ago:
-                    recent_results = True
-                number, score = match.groups()
+                # NOTE: drop emptied entries - otherwise, they'd still affect the latest match and lowest score
+                if not score_messages:
+                    del scores[score]
+                if not scores:
+                    del self.results[number]
+                return number
+        return None
 
-                # transform brick score ('X') into a numeric value for consistent parsing
-                score = f"{brick_score}" if score == "X" else score
+    def get_result_number(self, message_id: int) -> int | None:
+        """
+        Returns the wordle number of the result collected from a message (or None if no result was collected).
+        """
+        for number, scores in self.results.items():
+            for score_messages in scores.values():
+                if message_id in score_messages:
+                    return number
+        return None
 
-                number, score = map(int, (number, score))
-                results.setdefault(number, {}).setdefault(score, []).append(message)
+    def is_wordle_channel(self, channel_id: int) -> bool:
+        """
+        Returns True if the provided channel is the configured wordle channel.
+        """
+        return channel_id == self.bot.get_configuration().discord_wordle_channel_id
 
-            # if no wordle results have been posted in the last day, don't do anything
-            if not recent_results:
-                return
+    async def refresh_reactions(self, number: int | None):
+        """
+        Updates message reactions for the latest wordle match - if a change to the results of the wordle match
+        `number` could have affected them.
+        """
+        if number is None or not self.results:
+            return
+        latest_wordle_match = max(self.results.keys())
+        # NOTE: `number` can be newer than the latest wordle match if its results were all removed
+        if number >= latest_wordle_match:
+            await self.update_reactions(latest_wordle_match)
+
+    @Cog.listener()
+    async def on_message(self, message: Message):
+        """
+        Collects wordle results as they're posted - updating reactions for the latest wordle match if affected.
+        """
+        if not self.is_wordle_channel(message.channel.id):
+            return
+
+        # NOTE: until the initial history scan completes, messages are left for it to collect (see `Wordle.loop`)
+        if not self.cursor:
+            return
 
-            # determine the latest wordle match and the current winning score
-            latest_wordle_match = max(results.keys())
-            lowest_score = min(results[latest_wordle_match])
+        await self.refresh_reactions(self.add_result(message))
 
-            # manipulate message reactions
-            for score, score_messages in results[latest_wordle_match].items():
-                for message in score_messages:
-                    is_brick = score == brick_score
-                    is_winner = score == lowest_score
-                    has_green = green_emoji in message.content
-                    has_yellow = yellow_emoji in message.content
-                    bot_user = ensure_instance(bot.user, ClientUser)
+    @Cog.listener()
+    async def on_raw_message_edit(self, payload: RawMessageUpdateEvent):
+        """
+        Re-collects the wordle result of an edited message - updating reactions for the latest wordle match if affected.
+        """
+        if not self.is_wordle_channel(payload.channel_id) or not self.cursor:
+            return
+
+        # NOTE: edits without content (e.g., embeds being resolved) can't change a wordle result
+        content = payload.data.get("content")
+        if content is None:
+            return
+
+        # NOTE: `remove_result` forgets the bot's reactions - keep them, in case they need to be removed (see below)
+        bot_reactions = self.bot_reactions.get(payload.message_id, set())
+        removed_number = self.remove_result(payload.message_id)
+        channel = ensure_instance(self.bot.get_channel(payload.channel_id), TextChannel)
+        added_number = None
+        if parse_result(content):
+            message = await channel.fetch_message(payload.message_id)
+            added_number = self.add_result(message)
+        elif bot_reactions:
+            # the message no longer contains a wordle result - remove the bot's reactions (nothing else would)
+            bot_user = ensure_instance(self.bot.user, ClientUser)
+            partial_message = channel.get_partial_message(payload.message_id)
+            operations = [
+                remove_reaction(emoji, partial_message, bot_user, bot_reactions)
+                for emoji in list(bot_reactions)
+            ]
+            for result in await asyncio.gather(*operations, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.exception(f"wordle reaction failed", exc_info=result)
+
+        numbers = [n for n in (removed_number, added_number) if n is not None]
+        if numbers:
+            await self.refresh_reactions(max(numbers))
+
+    @Cog.listener()
+    async def on_raw_message_delete(self, payload: RawMessageDeleteEvent):
+        """
+        Discards the wordle result of a deleted message - updating reactions for the latest wordle match if affected.
+        """
+        if not self.is_wordle_channel(payload.channel_id):
+            return
+        await self.refresh_reactions(self.remove_result(payload.message_id))
+
+    @Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: RawBulkMessageDeleteEvent):
+        """
+        Discards the wordle results of deleted messages - updating reactions for the latest wordle match if affected.
+        """
+        if not self.is_wordle_channel(payload.channel_id):
+            return
+        numbers = [self.remove_result(message_id) for message_id in payload.message_ids]
+        numbers = [n for n in numbers if n is not None]
+        if numbers:
+            await self.refresh_reactions(max(numbers))
 
-                    # remove winner reaction for no-longer-winning scores
-                    if not is_winner:
-                        await remove_reaction(winner_emoji, message, bot_user)
+    @Cog.listener()
+    async def on_raw_reaction_remove(self, payload: RawReactionActionEvent):
+        """
+        Forgets a removed bot reaction - restoring it if still applicable.
+        """
+        if not self.bot.user or payload.user_id != self.bot.user.id:
+            return
+        bot_reactions = self.bot_reactions.get(payload.message_id)
+        if bot_reactions is None:
+            return
+        emoji = str(payload.emoji)
+        if emoji not in bot_reactions:
+            # NOTE: already forgotten (e.g., the bot removed the reaction itself - see `remove_reaction`)
+            return
+        bot_reactions.discard(emoji)
+        await self.refresh_reactions(self.get_result_number(payload.message_id))
+
+    @Cog.listener()
+    async def on_raw_reaction_clear(self, payload: RawReactionClearEvent):
+        """
+        Forgets all bot reactions to a message whose reactions were cleared - restoring them if still applicable.
+        """
+        bot_reactions = self.bot_reactions.get(payload.message_id)
+        if not bot_reactions:
+            return
+        bot_reactions.clear()
+        await self.refresh_reactions(self.get_result_number(payload.message_id))
 
-                    # add winner reaction to currently winning scores
-                    if is_winner:
-                        await add_reaction(winner_emoji, message)
+    @Cog.listener()
+    async def on_raw_reaction_clear_emoji(self, payload: RawReactionClearEmojiEvent):
+        """
+        Forgets a bot reaction that was cleared from a message - restoring it if still applicable.
+        """
+        bot_reactions = self.bot_reactions.get(payload.message_id)
+        emoji = str(payload.emoji)
+        if not bot_reactions or emoji not in bot_reactions:
+            return
+        bot_reactions.discard(emoji)
+        await self.refresh_reactions(self.get_result_number(payload.message_id))
 
-                    # add brick reaction for brick scores
-                    if is_brick:
-                        await add_reaction(brick_emoji, message)
+    async def update_reactions(self, number: int):
+        """
+        Updates message reactions for the results of a specific wordle match.
+        """
+        lowest_score = min(self.results[number])
 
-                    # add green reaction if wordle board is all green
-                    if has_green and not has_yellow:
-                        await add_reaction(green_emoji, message)
+        # NOTE: `bot_reactions` persists between updates - reactions already in place don't result in api calls
+        # NOTE: reaction changes are independent of one another - collect them and issue them concurrently
+        bot_user = ensure_instance(self.bot.user, ClientUser)
+        operations: list[Coroutine] = []
+        for score, score_messages in self.results[number].items():
+            for message in score_messages.values():
+                is_brick = score == brick_score
+                is_winner = score == lowest_score
+                content = message.content
+                has_green = green_emoji in content
+                has_yellow = yellow_emoji in content
+                bot_reactions = self.bot_reactions.get(message.id)
+                if bot_reactions is None:
+                    bot_reactions = get_bot_reactions(message)
+                    self.bot_reactions[message.id] = bot_reactions
 
-                    # add yellow reaction if wordle board is all yellow
-                    if has_yellow and not has_green:
-                        await add_reaction(yellow_emoji, message)
+                # add winner reaction to currently winning scores, remove it from no-longer-winning scores
+                if is_winner:
+                    operations.append(
+                        add_reaction(winner_emoji, message, bot_reactions)
+                    )
+                else:
+                    operations.append(
+                        remove_reaction(winner_emoji, message, bot_user, bot_reactions)
+                    )
+
+                # add brick reaction for brick scores
+                if is_brick:
+                    operations.append(add_reaction(brick_emoji, message, bot_reactions))
+
+                # add green reaction if wordle board is all green
+                if has_green and not has_yellow:
+                    operations.append(add_reaction(green_emoji, message, bot_reactions))
+
+                # add yellow reaction if wordle board is all yellow
+                if has_yellow and not has_green:
+                    operations.append(
+                        add_reaction(yellow_emoji, message, bot_reactions)
+                    )
+
+        for result in await asyncio.gather(*operations, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.exception(f"wordle reaction failed", exc_info=result)
+
+    @tasks.loop(hours=1.0)
+    async def loop(self):
+        """
+        Loop that catches up on channel history and discards stale wordle results.
+        """
+        try:
+            channel_id = self.bot.get_configuration().discord_wordle_channel_id
+            channel = ensure_instance(self.bot.get_channel(channel_id), TextChannel)
+            now = datetime.datetime.now(tz=datetime.timezone.utc)
+            one_day_ago = now - one_day
+            two_days_ago = now - two_days
+
+            # on the initial scan, check whether anything has been posted within the last day
+            # NOTE: if nothing has, there's nothing to react to - only collect messages posted from now on
+            if not self.cursor:
+                history = channel.history(limit=1, after=one_day_ago)
+                if not [message async for message in history]:
+                    self.cursor = Object(id=time_snowflake(now))
+                    return
+
+            # collect wordle results posted since the last history scan (initially, within the last two days)
+            # NOTE: history is fetched oldest-first, in batches - a full batch means more history remains to be scanned
+            # NOTE: messages already collected by `Wordle.on_message` are collected again - `add_result` is idempotent
+            cursor = self.cursor or Object(id=time_snowflake(two_days_ago))
+            while True:
+                count = 0
+                history = channel.history(limit=history_limit, after=cursor)
+                async for message in history:
+                    count += 1
+                    cursor = Object(id=message.id)
+                    self.add_result(message)
+                self.cursor = cursor
+                if count < history_limit:
+                    break
+            if not self.results:
+                return
+
+            # discard results for older wordle matches (they'll never be reacted to again)
+            latest_wordle_match = max(self.results.keys())
+            for number in [n for n in self.results if n < latest_wordle_match - 2]:
+                for score_messages in self.results.pop(number).values():
+                    for message_id in score_messages:
+                        self.bot_reactions.pop(message_id, None)
+
+            await self.update_reactions(latest_wordle_match)
 
         except Exception as e:
-            # NOTE: retryable exceptions (see __init__) are not logged - log them explicitly for informational purposes
+            # NOTE: retryable exceptions (see `cog_load`) are not logged - log them explicitly for informational purposes
             logger.exception(f"wordle task raised exception", exc_info=e)
             raise e
 
     @loop.before_loop
     async def before_loop(self):
         """
-        Ensures the bot is ready before polling begins
+        Ensures the bot is ready before the periodic task begins
         """
-        await bot.wait_until_ready()
+        await self.bot.wait_until_ready()
+
+
+async def setup(bot: Bot):
+    """
+    Adds the `Wordle` cog to the bot (called when the bot loads this module as an extension).
+    """
+    await bot.add_cog(Wordle(bot))
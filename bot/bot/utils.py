@@ -1,45 +1,15 @@
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Type, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, cast
 
 from discord import Interaction, VoiceState
 from discord.app_commands import Command
 from discord.channel import VocalGuildChannel
 from wavelink.player import VoiceChannel
 
+from bot.ensure import ensure_instance, ensure_subclass
+
 if TYPE_CHECKING:
     from bot.player import Player
 
-Instance = TypeVar("Instance")
-
-
-def ensure_subclass(obj: Any, v: Type[Instance]) -> Type[Instance]:
-    """
-    Convenience method that asserts a provided object is an subclass of the provided type.
-
-    This is because:
-    * `assert` statements can be removed from optimized python code
-    * typing.TypeGuard requires a `bool` function, and thus, an if statement - negating any benefit of a helper method
-    """
-    if not issubclass(obj, v):
-        raise RuntimeError(
-            f"not a {v.__qualname__} subclass ({type(obj).__qualname__})"
-        )
-    return obj
-
-
-def ensure_instance(obj: Any, v: Type[Instance]) -> Instance:
-    """
-    Convenience method that asserts a provided object is an instance of the provided type.
-
-    This is because:
-    * `assert` statements can be removed from optimized python code
-    * typing.TypeGuard requires a `bool` function, and thus, an if statement - negating any benefit of a helper method
-    """
-    if not isinstance(obj, v):
-        raise RuntimeError(
-            f"not an {v.__qualname__} instance ({type(obj).__qualname__})"
-        )
-    return obj
-
 
 def get_user_voice_channel(interaction: Interaction) -> VocalGuildChannel | None:
     """